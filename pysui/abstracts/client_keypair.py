@@ -82,13 +82,18 @@ class Key(ABC):
 class PublicKey(Key):
     """PublicKey construct."""
 
+    def __init__(self, scheme: SignatureScheme, key_bytes: bytes) -> None:
+        """Init with byte array, precomputing the scheme prefixed key bytes."""
+        super().__init__(scheme, key_bytes)
+        self._scheme_and_key = bytes((scheme.value,)) + key_bytes
+
     def scheme_and_key(self) -> bytes:
         """scheme_and_key returns bytes of key scheme + pubkey bytes.
 
         :return: pubkey bytes with scheme value prefix
         :rtype: bytes
         """
-        return self.scheme.value.to_bytes(1, "little") + self.key_bytes
+        return self._scheme_and_key
 
 
 class PrivateKey(Key):
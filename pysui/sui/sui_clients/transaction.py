@@ -612,6 +612,22 @@ class SuiTransaction:
                 return self.builder.make_move_vector(type_tag, items)
         raise ValueError("make_vector requires a non-empty list")
 
+    @staticmethod
+    @versionadded(version="0.25.1", reason="Replaces setting Mutable on possibly shared references")
+    def _mutable_object_arg(arg: tuple[bcs.BuilderArg, bcs.ObjectArg]) -> tuple[bcs.BuilderArg, bcs.ObjectArg]:
+        """Return the object argument for a mutable reference parameter.
+
+        Shared object references get a new, mutable, SharedObjectReference rather than being modified in place.
+        """
+        b_arg, r_arg = arg
+        if r_arg.enum_name != "SharedObject":
+            return arg
+        shared: bcs.SharedObjectReference = r_arg.value
+        return (
+            b_arg,
+            bcs.ObjectArg("SharedObject", bcs.SharedObjectReference(shared.ObjectID, shared.SequenceNumber, True)),
+        )
+
     # TODO: Investigate functools LRU
     @versionchanged(version="0.20.2", reason="Capture function argument meta data as well")
     def _move_call_target_cache(self, target: str) -> tuple[bcs.Address, str, str, list, int]:
@@ -677,8 +693,7 @@ class SuiTransaction:
             for index, arg in enumerate(arguments):
                 parm = parameters[index]
                 if hasattr(parm, "is_mutable") and parm.is_mutable and isinstance(arg, tuple):
-                    r_arg: bcs.ObjectArg = arg[1]
-                    r_arg.value.Mutable = True
+                    arguments[index] = self._mutable_object_arg(arg)
         else:
             arguments = []
         # Standardize the type_arguments to list
@@ -724,8 +739,7 @@ class SuiTransaction:
             for index, arg in enumerate(arguments):
                 parm = parameters[index]
                 if hasattr(parm, "is_mutable") and parm.is_mutable and isinstance(arg, tuple):
-                    r_arg: bcs.ObjectArg = arg[1]
-                    r_arg.value.Mutable = True
+                    arguments[index] = self._mutable_object_arg(arg)
 
         type_arguments = type_arguments if isinstance(type_arguments, list) else []
         return self.builder.move_call(
@@ -737,9 +751,9 @@ class SuiTransaction:
             res_count=res_count,
         )
 
-    def _to_bytes_from_str(self, inbound: Union[str, SuiString]) -> list[int]:
-        """Utility to convert base64 string to bytes then as list of u8."""
-        return list(base64.b64decode(inbound if isinstance(inbound, str) else inbound.value))
+    def _to_bytes_from_str(self, inbound: Union[str, SuiString]) -> bytes:
+        """Utility to convert base64 string to bytes, BCS Publish/Upgrade copy module bytes as is."""
+        return base64.b64decode(inbound if isinstance(inbound, str) else inbound.value)
 
     @versionchanged(
         version="0.20.0", reason="Removed recipient. Transfer of UpgradeCap up to user as per Sui best practice."
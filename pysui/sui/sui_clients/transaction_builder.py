@@ -20,6 +20,7 @@ from math import ceil
 from typing import Optional, Set, Union
 from functools import singledispatchmethod
 
+import canoser
 from deprecated.sphinx import versionchanged
 
 from pysui.sui.sui_types import bcs
@@ -48,6 +49,7 @@ _SUI_PACAKGE_COMMIt_UPGRADE: str = "commit_upgrade"
 
 @versionchanged(version="0.17.0", reason="Support bool arguments")
 @versionchanged(version="0.18.0", reason="Support for lists and unsigned ints")
+@versionchanged(version="0.25.1", reason="str and list lengths are ULEB128 encoded")
 class PureInput:
     """Pure inputs processing."""
 
@@ -157,10 +159,9 @@ class PureInput:
     @pure.register
     @classmethod
     def _(cls, arg: str) -> list:
-        """Convert str to list of bytes."""
-        base_list = list(bytearray(arg, encoding="utf-8"))
-        base_list.insert(0, len(base_list))
-        return base_list
+        """Convert str to ULEB128 length prefixed list of bytes."""
+        encoded = arg.encode("utf-8")
+        return list(canoser.Uint32.serialize_uint32_as_uleb128(len(encoded)) + encoded)
 
     @pure.register
     @classmethod
@@ -202,11 +203,10 @@ class PureInput:
     @pure.register
     @classmethod
     def _(cls, arg: list) -> list:
-        """."""
-        stage_list = [PureInput.pure(x) for x in arg]
-        res_list = [len(stage_list)]
-        for stage_pure in stage_list:
-            res_list.extend(stage_pure)
+        """Convert list to ULEB128 length prefixed list of each item's bytes."""
+        res_list = list(canoser.Uint32.serialize_uint32_as_uleb128(len(arg)))
+        for item in arg:
+            res_list.extend(PureInput.pure(item))
         return res_list
 
     @classmethod
@@ -411,7 +411,7 @@ class ProgrammableTransactionBuilder:
         return self.command(bcs.Command("TransferObjects", bcs.TransferObjects([coin_arg], reciever_arg)))
 
     @versionchanged(version="0.20.0", reason="Removed UpgradeCap auto transfer as per Sui best practices.")
-    def publish(self, modules: list[list[bcs.U8]], dep_ids: list[bcs.Address]) -> bcs.Argument:
+    def publish(self, modules: list[Union[list[bcs.U8], bytes]], dep_ids: list[bcs.Address]) -> bcs.Argument:
         """Setup a Publish command and return it's result Argument."""
         # result = self.command(bcs.Command("Publish", bcs.Publish(modules, dep_ids)))
         return self.command(bcs.Command("Publish", bcs.Publish(modules, dep_ids)))
@@ -435,7 +435,7 @@ class ProgrammableTransactionBuilder:
 
     def publish_upgrade(
         self,
-        modules: list[list[bcs.U8]],
+        modules: list[Union[list[bcs.U8], bytes]],
         dep_ids: list[bcs.Address],
         package_id: bcs.Address,
         upgrade_ticket: bcs.Argument,
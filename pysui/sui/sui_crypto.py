@@ -16,21 +16,39 @@
 
 import os
 import ast
-import base64
+import ctypes
 import binascii
+import functools
 import hashlib
 import subprocess
 import json
-from typing import Union
+import unicodedata
+from abc import abstractmethod
+from typing import Callable, Union
+
+try:
+    # SIMD accelerated base64 when available
+    import pybase64 as base64
+except ImportError:
+    import base64
 from deprecated.sphinx import versionadded, versionchanged, deprecated
 import pyroaring
 import bip_utils
-import ecdsa
+import coincurve
+from coincurve.context import GLOBAL_CONTEXT
+from coincurve.ecdsa import cdata_to_der, deserialize_compact
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.asymmetric.utils import decode_dss_signature, encode_dss_signature
+from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
 from bip_utils.addr.addr_key_validator import AddrKeyValidator
 from bip_utils.bip.bip39.bip39_mnemonic_decoder import Bip39MnemonicDecoder
 from bip_utils.utils.mnemonic.mnemonic_validator import MnemonicValidator
+from nacl.exceptions import BadSignatureError
 from nacl.signing import SigningKey, VerifyKey
-from nacl.encoding import Base64Encoder, RawEncoder
+from nacl.encoding import RawEncoder
+from nacl import _sodium
 
 
 from pysui.abstracts import KeyPair, PrivateKey, PublicKey, SignatureScheme
@@ -45,7 +63,6 @@ from pysui.sui.sui_excepts import (
 from pysui.sui.sui_constants import (
     PYSUI_EXEC_ENV,
     SCHEME_PRIVATE_KEY_BYTE_LEN,
-    SUI_KEYPAIR_LEN,
     ED25519_DEFAULT_KEYPATH,
     ED25519_PUBLICKEY_BYTES_LEN,
     ED25519_PRIVATEKEY_BYTES_LEN,
@@ -67,6 +84,23 @@ from pysui.sui.sui_types.scalars import SuiTxBytes
 _SUI_MS_SIGN_CMD: list[str] = ["keytool", "multi-sig-combine-partial-sig"]
 """Use sui binary keytool for MultiSig signing."""
 
+_INTENT_PREFIX: bytes = b"\x00\x00\x00"
+"""Transaction intent (scope, version, app id) prepended to tx bytes for signing."""
+
+_SECP256R1_ORDER: int = 0xFFFFFFFF00000000FFFFFFFFFFFFFFFFBCE6FAADA7179E84F3B9CAC2FC632551
+"""secp256r1 curve order."""
+_SECP256R1_HALF_ORDER: int = _SECP256R1_ORDER >> 1
+"""Upper bound of a low-s secp256r1 signature s value."""
+
+_SECP256K1_ORDER: int = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+"""secp256k1 curve order."""
+
+_SECP256K1_CTX = GLOBAL_CONTEXT
+"""Shared libsecp256k1 context, created (and randomized) once per process."""
+
+_SODIUM_SIMD_LEVELS: tuple[str, ...] = ("avx512f", "avx2", "avx", "sse41", "ssse3", "sse3", "sse2", "neon")
+"""CPU features libsodium detects at runtime, highest first."""
+
 
 class SuiPublicKey(PublicKey):
     """SuiPublicKey Sui Basic public key."""
@@ -76,6 +110,19 @@ class SuiPublicKey(PublicKey):
         """Return self as base64 encoded string."""
         return self.to_b64()
 
+    @abstractmethod
+    @versionadded(version="0.25.1", reason="Signature verification")
+    def verify(self, message: bytes, signature: bytes) -> bool:
+        """verify Verify a signature produced by the corresponding private key `sign`.
+
+        :param message: The data that was signed
+        :type message: bytes
+        :param signature: The signature bytes (without scheme flag or public key)
+        :type signature: bytes
+        :return: True if the signature is valid for this key
+        :rtype: bool
+        """
+
 
 class SuiPrivateKey(PrivateKey):
     """SuiPrivateKey Sui Basic private/signing key."""
@@ -92,16 +139,13 @@ class SuiPrivateKey(PrivateKey):
         :return: Singed transaction as bytes
         :rtype: bytes
         """
-        # Sign hash of transaction intent
-        indata = bytearray([0, 0, 0])
-        indata.extend(base64.b64decode(tx_data))
-        sig_bytes = self.sign(hashlib.blake2b(indata, digest_size=32).digest(), recovery_id)
+        # Sign hash of transaction intent, fed incrementally to avoid a concatenated copy
+        intent_hash = hashlib.blake2b(_INTENT_PREFIX, digest_size=32)
+        intent_hash.update(base64.b64decode(tx_data))
+        sig_bytes = self.sign(intent_hash.digest(), recovery_id)
         # Embelish results
         # flag | sig | public_key
-        compound = bytearray([self.scheme])
-        compound.extend(sig_bytes)
-        compound.extend(public_key.key_bytes)
-        return bytes(compound)
+        return b"".join((bytes((self.scheme,)), sig_bytes, public_key.key_bytes))
 
 
 class SuiKeyPair(KeyPair):
@@ -153,8 +197,7 @@ class SuiKeyPair(KeyPair):
 
     def to_bytes(self) -> bytes:
         """Convert keypair to bytes."""
-        all_bytes = self.scheme.to_bytes(1, "little") + self.public_key.key_bytes + self.private_key.key_bytes
-        return all_bytes
+        return self.public_key.scheme_and_key() + self.private_key.key_bytes
 
     def __repr__(self) -> str:
         """To string."""
@@ -164,6 +207,7 @@ class SuiKeyPair(KeyPair):
 # Secp256r1 Curve Keys
 
 
+@versionchanged(version="0.25.1", reason="Move from using ecdsa library to cryptography")
 class SuiPublicKeySECP256R1(SuiPublicKey):
     """A secp256r1 Public Key."""
 
@@ -172,9 +216,25 @@ class SuiPublicKeySECP256R1(SuiPublicKey):
         if len(indata) != SECP256R1_PUBLICKEY_BYTES_LEN:
             raise SuiInvalidKeyPair(f"Public Key expects {SECP256R1_PUBLICKEY_BYTES_LEN} bytes, found {len(indata)}")
         super().__init__(SignatureScheme.SECP256R1, indata)
-        self._verify_key = ecdsa.VerifyingKey.from_string(indata, curve=ecdsa.NIST256p, hashfunc=hashlib.sha256)
+        # Parsing the point validates it, the parsed key is kept for verification
+        try:
+            self._verify_key = ec.EllipticCurvePublicKey.from_encoded_point(ec.SECP256R1(), indata)
+        except ValueError as verr:
+            raise SuiInvalidKeyPair(f"Public Key is not a valid secp256r1 point: {verr}") from verr
+
+    def verify(self, message: bytes, signature: bytes) -> bool:
+        """SECP256R1 verify r|s signature of message."""
+        if len(signature) != 64:
+            return False
+        der_sig = encode_dss_signature(int.from_bytes(signature[:32], "big"), int.from_bytes(signature[32:], "big"))
+        try:
+            self._verify_key.verify(der_sig, message, ec.ECDSA(hashes.SHA256()))
+            return True
+        except InvalidSignature:
+            return False
 
 
+@versionchanged(version="0.25.1", reason="Move from using ecdsa library to cryptography")
 class SuiPrivateKeySECP256R1(SuiPrivateKey):
     """A secp256r1 Private Key."""
 
@@ -184,21 +244,18 @@ class SuiPrivateKeySECP256R1(SuiPrivateKey):
         if dlen != SECP256R1_PRIVATEKEY_BYTES_LEN:
             raise SuiInvalidKeyPair(f"Private Key expects {SECP256R1_PRIVATEKEY_BYTES_LEN} bytes, found {dlen}")
         super().__init__(SignatureScheme.SECP256R1, indata)
-        self._signing_key = ecdsa.SigningKey.from_string(indata, ecdsa.NIST256p, hashfunc=hashlib.sha256)
+        self._signing_key = ec.derive_private_key(int.from_bytes(indata, "big"), ec.SECP256R1())
 
     def sign(self, data: bytes, recovery_id: int = 0) -> bytes:
         """SECP256R1 signing bytes."""
-
-        def _sigencode_string(r_int: int, s_int: int, order: int) -> bytes:
-            """s adjustment to go small."""
-            _s_max = 0xFFFFFFFF00000000FFFFFFFFFFFFFFFFBCE6FAADA7179E84F3B9CAC2FC632551
-            if s_int > _s_max / 2:
-                s_int = _s_max - s_int
-            return ecdsa.util.sigencode_string(r_int, s_int, order)
-
-        return self._signing_key.sign_deterministic(data, hashfunc=hashlib.sha256, sigencode=_sigencode_string)
+        r_int, s_int = decode_dss_signature(self._signing_key.sign(data, ec.ECDSA(hashes.SHA256())))
+        # s adjustment to go small
+        if s_int > _SECP256R1_HALF_ORDER:
+            s_int = _SECP256R1_ORDER - s_int
+        return r_int.to_bytes(32, "big") + s_int.to_bytes(32, "big")
 
 
+@versionchanged(version="0.25.1", reason="Move from using ecdsa library to cryptography")
 class SuiKeyPairSECP256R1(SuiKeyPair):
     """A SuiKey Pair."""
 
@@ -207,18 +264,18 @@ class SuiKeyPairSECP256R1(SuiKeyPair):
         super().__init__()
         self._scheme = SignatureScheme.SECP256R1
         self._private_key = SuiPrivateKeySECP256R1(secret_bytes)
-        pub_bytes = self._private_key._signing_key.get_verifying_key().to_string(encoding="compressed")
+        pub_bytes = self._private_key._signing_key.public_key().public_bytes(
+            Encoding.X962, PublicFormat.CompressedPoint
+        )
         self._public_key = SuiPublicKeySECP256R1(pub_bytes)
 
     @classmethod
     def from_b64(cls, indata: str) -> KeyPair:
         """Convert base64 string to keypair."""
-        if len(indata) != SUI_KEYPAIR_LEN:
-            raise SuiInvalidKeyPair(f"Expect str len of {SUI_KEYPAIR_LEN}")
-        base_decode = base64.b64decode(indata)
-        if base_decode[0] == SignatureScheme.SECP256R1:
-            return SuiKeyPairSECP256R1.from_bytes(base_decode[1:])
-        raise SuiInvalidKeyPair("Scheme not SECP256R1")
+        base_decode = base64.b64decode(indata, validate=True)
+        if len(base_decode) != SCHEME_PRIVATE_KEY_BYTE_LEN:
+            raise SuiInvalidKeyPair(f"Expect decoded bytes len of {SCHEME_PRIVATE_KEY_BYTE_LEN}")
+        return cls.from_raw(base_decode)
 
     @classmethod
     def from_bytes(cls, indata: bytes) -> KeyPair:
@@ -227,6 +284,16 @@ class SuiKeyPairSECP256R1(SuiKeyPair):
             raise SuiInvalidKeyPair(f"Expect bytes len of {SECP256R1_KEYPAIR_BYTES_LEN}")
         return SuiKeyPairSECP256R1(indata)
 
+    @classmethod
+    @versionadded(version="0.25.1", reason="Keypair from raw bytes without base64 encoding")
+    def from_raw(cls, raw: bytes) -> KeyPair:
+        """Convert raw private key bytes, with or without the scheme prefix byte, to keypair."""
+        if len(raw) == SCHEME_PRIVATE_KEY_BYTE_LEN:
+            if raw[0] != SignatureScheme.SECP256R1:
+                raise SuiInvalidKeyPair("Scheme not SECP256R1")
+            raw = raw[1:]
+        return cls.from_bytes(raw)
+
 
 class SuiPublicKeyED25519(SuiPublicKey):
     """A ED25519 Public Key."""
@@ -236,7 +303,19 @@ class SuiPublicKeyED25519(SuiPublicKey):
         if len(indata) != ED25519_PUBLICKEY_BYTES_LEN:
             raise SuiInvalidKeyPair(f"Public Key expects {ED25519_PUBLICKEY_BYTES_LEN} bytes, found {len(indata)}")
         super().__init__(SignatureScheme.ED25519, indata)
-        self._verify_key = VerifyKey(self.to_b64(), encoder=Base64Encoder)
+
+    @functools.cached_property
+    def _verify_key(self) -> VerifyKey:
+        """Lazily instantiate the verifying key."""
+        return VerifyKey(self.key_bytes)
+
+    def verify(self, message: bytes, signature: bytes) -> bool:
+        """ED25519 verify signature of message."""
+        try:
+            self._verify_key.verify(message, signature)
+            return True
+        except (BadSignatureError, ValueError):
+            return False
 
 
 class SuiPrivateKeyED25519(SuiPrivateKey):
@@ -248,7 +327,11 @@ class SuiPrivateKeyED25519(SuiPrivateKey):
         if dlen != ED25519_PRIVATEKEY_BYTES_LEN:
             raise SuiInvalidKeyPair(f"Private Key expects {ED25519_PRIVATEKEY_BYTES_LEN} bytes, found {dlen}")
         super().__init__(SignatureScheme.ED25519, indata)
-        self._signing_key = SigningKey(self.to_b64(), encoder=Base64Encoder)
+
+    @functools.cached_property
+    def _signing_key(self) -> SigningKey:
+        """Lazily instantiate the signing key."""
+        return SigningKey(self.key_bytes)
 
     def sign(self, data: bytes, _recovery_id: int = 0) -> bytes:
         """ED25519 sign data bytes."""
@@ -269,12 +352,10 @@ class SuiKeyPairED25519(SuiKeyPair):
     @classmethod
     def from_b64(cls, indata: str) -> KeyPair:
         """Convert base64 string to keypair."""
-        if len(indata) != SUI_KEYPAIR_LEN:
-            raise SuiInvalidKeyPair(f"Expect str len of {SUI_KEYPAIR_LEN}")
-        base_decode = base64.b64decode(indata)
-        if base_decode[0] == SignatureScheme.ED25519:
-            return SuiKeyPairED25519.from_bytes(base_decode[1:])
-        raise SuiInvalidKeyPair("Scheme not ED25519")
+        base_decode = base64.b64decode(indata, validate=True)
+        if len(base_decode) != SCHEME_PRIVATE_KEY_BYTE_LEN:
+            raise SuiInvalidKeyPair(f"Expect decoded bytes len of {SCHEME_PRIVATE_KEY_BYTE_LEN}")
+        return cls.from_raw(base_decode)
 
     @classmethod
     def from_bytes(cls, indata: bytes) -> KeyPair:
@@ -283,8 +364,19 @@ class SuiKeyPairED25519(SuiKeyPair):
             raise SuiInvalidKeyPair(f"Expect bytes len of {ED25519_KEYPAIR_BYTES_LEN}")
         return SuiKeyPairED25519(indata)
 
+    @classmethod
+    @versionadded(version="0.25.1", reason="Keypair from raw bytes without base64 encoding")
+    def from_raw(cls, raw: bytes) -> KeyPair:
+        """Convert raw private key bytes, with or without the scheme prefix byte, to keypair."""
+        if len(raw) == SCHEME_PRIVATE_KEY_BYTE_LEN:
+            if raw[0] != SignatureScheme.ED25519:
+                raise SuiInvalidKeyPair("Scheme not ED25519")
+            raw = raw[1:]
+        return cls.from_bytes(raw)
+
 
 @versionchanged(version="0.22.1", reason="Move from using secp256k1 library")
+@versionchanged(version="0.25.1", reason="Move from using ecdsa library to coincurve")
 class SuiPublicKeySECP256K1(SuiPublicKey):
     """A SECP256K1 Public Key."""
 
@@ -293,10 +385,29 @@ class SuiPublicKeySECP256K1(SuiPublicKey):
         if len(indata) != SECP256K1_PUBLICKEY_BYTES_LEN:
             raise SuiInvalidKeyPair(f"Public Key expects {SECP256K1_PUBLICKEY_BYTES_LEN} bytes, found {len(indata)}")
         super().__init__(SignatureScheme.SECP256K1, indata)
-        self._verify_key = ecdsa.VerifyingKey.from_string(indata, curve=ecdsa.SECP256k1)
+        # Parsing the point validates it, the parsed key is kept for verification
+        try:
+            self._verify_key = coincurve.PublicKey(indata, context=_SECP256K1_CTX)
+        except ValueError as verr:
+            raise SuiInvalidKeyPair(f"Public Key is not a valid secp256k1 point: {verr}") from verr
+
+    def verify(self, message: bytes, signature: bytes) -> bool:
+        """secp256k1 verify compact r|s signature of message."""
+        if len(signature) != 64:
+            return False
+        # Out of range r or s fail an assertion in coincurve's compact parse
+        if max(int.from_bytes(signature[:32], "big"), int.from_bytes(signature[32:], "big")) >= _SECP256K1_ORDER:
+            return False
+        try:
+            return self._verify_key.verify(
+                cdata_to_der(deserialize_compact(signature, _SECP256K1_CTX), _SECP256K1_CTX), message
+            )
+        except ValueError:
+            return False
 
 
 @versionchanged(version="0.22.1", reason="Move from using secp256k1 library")
+@versionchanged(version="0.25.1", reason="Move from using ecdsa library to coincurve")
 class SuiPrivateKeySECP256K1(SuiPrivateKey):
     """A SECP256K1 Private Key."""
 
@@ -305,14 +416,16 @@ class SuiPrivateKeySECP256K1(SuiPrivateKey):
         if len(indata) != SECP256K1_PRIVATEKEY_BYTES_LEN:
             raise SuiInvalidKeyPair(f"Private Key expects {SECP256K1_PRIVATEKEY_BYTES_LEN} bytes, found {len(indata)}")
         super().__init__(SignatureScheme.SECP256K1, indata)
-        self._signing_key = ecdsa.SigningKey.from_string(indata, curve=ecdsa.SECP256k1, hashfunc=hashlib.sha256)
+        self._signing_key = coincurve.PrivateKey(indata, context=_SECP256K1_CTX)
 
     def sign(self, data: bytes, _recovery_id: int = 0) -> bytes:
         """secp256k1 sign data bytes."""
-        return self._signing_key.sign_deterministic(data)
+        # Compact r|s (low s normalized), dropping the trailing recovery byte
+        return self._signing_key.sign_recoverable(data)[:64]
 
 
 @versionchanged(version="0.22.1", reason="Move from using secp256k1 library")
+@versionchanged(version="0.25.1", reason="Move from using ecdsa library to coincurve")
 class SuiKeyPairSECP256K1(SuiKeyPair):
     """A SuiKey Pair."""
 
@@ -321,18 +434,16 @@ class SuiKeyPairSECP256K1(SuiKeyPair):
         super().__init__()
         self._scheme = SignatureScheme.SECP256K1
         self._private_key = SuiPrivateKeySECP256K1(secret_bytes)
-        pubkey_bytes = self._private_key._signing_key.get_verifying_key().to_string("compressed")
+        pubkey_bytes = self._private_key._signing_key.public_key.format(compressed=True)
         self._public_key = SuiPublicKeySECP256K1(pubkey_bytes)
 
     @classmethod
     def from_b64(cls, indata: str) -> KeyPair:
         """Convert base64 string to keypair."""
-        if len(indata) != SUI_KEYPAIR_LEN:
-            raise SuiInvalidKeyPair(f"Expect str len of {SUI_KEYPAIR_LEN}")
-        base_decode = base64.b64decode(indata)
-        if base_decode[0] == SignatureScheme.SECP256K1:
-            return SuiKeyPairSECP256K1.from_bytes(base_decode[1:])
-        raise SuiInvalidKeyPair("Scheme not SECP256K1")
+        base_decode = base64.b64decode(indata, validate=True)
+        if len(base_decode) != SCHEME_PRIVATE_KEY_BYTE_LEN:
+            raise SuiInvalidKeyPair(f"Expect decoded bytes len of {SCHEME_PRIVATE_KEY_BYTE_LEN}")
+        return cls.from_raw(base_decode)
 
     @classmethod
     def from_bytes(cls, indata: bytes) -> KeyPair:
@@ -341,6 +452,16 @@ class SuiKeyPairSECP256K1(SuiKeyPair):
             raise SuiInvalidKeyPair("Expect bytes len of 65")
         return SuiKeyPairSECP256K1(indata)
 
+    @classmethod
+    @versionadded(version="0.25.1", reason="Keypair from raw bytes without base64 encoding")
+    def from_raw(cls, raw: bytes) -> KeyPair:
+        """Convert raw private key bytes, with or without the scheme prefix byte, to keypair."""
+        if len(raw) == SCHEME_PRIVATE_KEY_BYTE_LEN:
+            if raw[0] != SignatureScheme.SECP256K1:
+                raise SuiInvalidKeyPair("Scheme not SECP256K1")
+            raw = raw[1:]
+        return cls.from_bytes(raw)
+
 
 class MultiSig:
     """Multi signature support."""
@@ -386,11 +507,11 @@ class MultiSig:
         :rtype: SuiAddress
         """
         # Build the digest to generate a SuiAddress (hash) from
-        digest = self._schema.to_bytes(1, "little")
+        digest = bytearray((self._schema,))
         digest += self._threshold.to_bytes(2, "little")
-        for index, kkeys in enumerate(self._keys):
+        for kkeys, weight in zip(self._keys, self._weights):
             digest += kkeys.public_key.scheme_and_key()
-            digest += self._weights[index].to_bytes(1, "little")
+            digest.append(weight)
         return SuiAddress(hashlib.blake2b(digest, digest_size=32).hexdigest())
 
     @property
@@ -435,7 +556,7 @@ class MultiSig:
         """Validate pubkeys part of multisig and have enough weight."""
         # Must be subset of full ms list
         if len(pub_keys) <= len(self._public_keys):
-            hit_indexes = [i for i, j in enumerate(pub_keys) if j in self._public_keys]
+            hit_indexes = sorted(self._public_keys.index(j) for j in pub_keys if j in self._public_keys)
             # If all inbound pubkeys have reference to item in ms list
             if len(hit_indexes) == len(pub_keys):
                 if sum([self._weights[x] for x in hit_indexes]) >= self._threshold:
@@ -489,12 +610,12 @@ class MultiSig:
         """Validate pubkeys part of multisig and have enough weight."""
         # Must be subset of full ms list
         assert len(pub_keys) <= len(self._public_keys), "More public keys than MultiSig"
-        hit_indexes = [i for i, j in enumerate(pub_keys) if j in self._public_keys]
+        # Indexes into the MultiSig keys, ascending to align with the signer bitmap
+        hit_indexes = sorted(self._public_keys.index(j) for j in pub_keys if j in self._public_keys)
 
         # If all inbound pubkeys have reference to item in ms list
         assert len(hit_indexes) == len(pub_keys), "Public key not part of MultiSig keys"
-        weights = [self._weights[x] for x in hit_indexes]
-        return hit_indexes, list(zip(pub_keys, weights))
+        return hit_indexes, [(self._public_keys[x], self._weights[x]) for x in hit_indexes]
 
     @versionadded(version="0.21.1", reason="Support for inline multisig signing")
     def _compressed_signatures(self, tx_bytes: str, key_indices: list[int]) -> list[MsCompressedSig]:
@@ -567,11 +688,7 @@ class MultiSig:
             key_block: list[SuiKeyPair] = []
             for idex in range(count):
                 start = kes_index + (idex * SCHEME_PRIVATE_KEY_BYTE_LEN)
-                key_block.append(
-                    keypair_from_keystring(
-                        base64.b64encode(ms_bytes[start : start + SCHEME_PRIVATE_KEY_BYTE_LEN]).decode()
-                    )
-                )
+                key_block.append(_keypair_from_raw(ms_bytes[start : start + SCHEME_PRIVATE_KEY_BYTE_LEN]))
             # Get the weights
             weight_block: list[int] = []
             for idex in range(count):
@@ -585,6 +702,64 @@ class MultiSig:
 
 
 # Utility functions
+@functools.cache
+@versionadded(version="0.25.1", reason="Report CPU features detected by libsodium")
+def crypto_backend() -> str:
+    """crypto_backend Return the highest CPU feature detected by libsodium at runtime.
+
+    This reports what libsodium, as bundled with PyNaCl, detected on the CPU. It does not identify
+    the implementation used for a given primitive, for example there is no AVX-512 ED25519 path.
+    The result is computed once and cached.
+
+    :return: One of avx512f, avx2, avx, sse41, ssse3, sse3, sse2, neon or portable
+    :rtype: str
+    """
+    sodium = ctypes.CDLL(_sodium.__file__)
+    for level in _SODIUM_SIMD_LEVELS:
+        probe = getattr(sodium, f"sodium_runtime_has_{level}", None)
+        if probe is not None and probe():
+            return level
+    return "portable"
+
+
+def _bip39_seed(mnemonic: str, passphrase: str = "") -> bytes:
+    """_bip39_seed Generate the BIP39 seed from a validated mnemonic phrase.
+
+    :param mnemonic: space separated mnemonic word string
+    :type mnemonic: str
+    :param passphrase: optional seed passphrase, defaults to ""
+    :type passphrase: str, optional
+    :return: 64 byte seed
+    :rtype: bytes
+    """
+    return hashlib.pbkdf2_hmac(
+        "sha512",
+        unicodedata.normalize("NFKD", mnemonic).encode("utf-8"),
+        unicodedata.normalize("NFKD", "mnemonic" + passphrase).encode("utf-8"),
+        2048,
+        64,
+    )
+
+
+def _derive(curve_cls: type, seed_bytes: bytes, derv_path: str) -> bytes:
+    """_derive BIP32 derive the private key bytes for a curve, seed and derivation path.
+
+    :param curve_cls: The bip_utils Bip32Slip10 class for the curve
+    :type curve_cls: type
+    :param seed_bytes: BIP39 seed
+    :type seed_bytes: bytes
+    :param derv_path: derivation path
+    :type derv_path: str
+    :return: raw private key bytes
+    :rtype: bytes
+    """
+    return curve_cls.FromSeedAndPath(seed_bytes, derv_path).PrivateKey().Raw().ToBytes()
+
+
+_derive_cached: Callable[[type, bytes, str], bytes] = functools.lru_cache(maxsize=256)(_derive)
+"""Memoized _derive, only used for caller supplied mnemonics."""
+
+
 def _valid_mnemonic(mnemonics: Union[str, list[str]] = "") -> str:
     """_valid_mnemonic Validate, or create, mnemonic word string.
 
@@ -604,11 +779,16 @@ def _valid_mnemonic(mnemonics: Union[str, list[str]] = "") -> str:
     return bip_utils.Bip39MnemonicGenerator().FromWordsNumber(bip_utils.Bip39WordsNum.WORDS_NUM_24).ToStr()
 
 
+@versionchanged(version="0.25.1", reason="Keys derived from supplied mnemonics are cached")
 def create_new_keypair(
     scheme: SignatureScheme = SignatureScheme.ED25519, mnemonics: Union[str, list[str]] = "", derv_path: str = None
 ) -> tuple[str, SuiKeyPair]:
     """create_new_keypair Generate a new keypair.
 
+    When mnemonics are supplied the derived private key is cached by seed and derivation path
+    (up to 256 entries), keys from newly generated mnemonics are never cached. As the cache holds
+    private key material, call `create_new_keypair.cache_clear()` to purge it when keys are no longer needed.
+
     :param keytype: One of ED25519, SECP256K1 or SECP256R1 key type, defaults to SignatureScheme.ED25519
     :type keytype: SignatureScheme, optional
     :param mnemonics: mnemonic words, defaults to None
@@ -620,7 +800,8 @@ def create_new_keypair(
     :rtype: tuple[str, KeyPair]
     """
     mnemonic_phrase = _valid_mnemonic(mnemonics)
-    seed_bytes = bip_utils.Bip39SeedGenerator(mnemonic_phrase).Generate()
+    seed_bytes = _bip39_seed(mnemonic_phrase)
+    derive = _derive_cached if mnemonics else _derive
     validation_str: str = ""
     key_clazz = None
     vkey = None
@@ -628,8 +809,7 @@ def create_new_keypair(
     match scheme:
         case SignatureScheme.ED25519:
             # 1. Private, or signer, key
-            bip32_ctx = bip_utils.Bip32Slip10Ed25519.FromSeedAndPath(seed_bytes, derv_path or ED25519_DEFAULT_KEYPATH)
-            ed_priv = SigningKey(base64.b64encode(bip32_ctx.PrivateKey().Raw().ToBytes()), encoder=Base64Encoder)
+            ed_priv = SigningKey(derive(bip_utils.Bip32Slip10Ed25519, seed_bytes, derv_path or ED25519_DEFAULT_KEYPATH))
             pkey = ed_priv.encode()
             # 2. Public, or verifier, key
             vkey = ed_priv.verify_key.encode()
@@ -637,29 +817,23 @@ def create_new_keypair(
             validation_str = "ValidateAndGetEd25519Key"
 
         case SignatureScheme.SECP256K1:
-            bip32_ctx = bip_utils.Bip32Slip10Secp256k1.FromSeedAndPath(
-                seed_bytes, derv_path or SECP256K1_DEFAULT_KEYPATH
-            )
-            bip32_ctx = bip_utils.Bip32Slip10Secp256k1.FromSeedAndPath(
-                seed_bytes, derv_path or SECP256K1_DEFAULT_KEYPATH
-            )
             # 1. Private, or signer, key
-            secp_priv = ecdsa.SigningKey.from_string(bip32_ctx.PrivateKey().Raw().ToBytes(), curve=ecdsa.SECP256k1)
-            pkey = secp_priv.to_string()
+            secp_priv = coincurve.PrivateKey(
+                derive(bip_utils.Bip32Slip10Secp256k1, seed_bytes, derv_path or SECP256K1_DEFAULT_KEYPATH),
+                context=_SECP256K1_CTX,
+            )
+            pkey = secp_priv.secret
             # 2. Public, or verifier, key
-            vkey = secp_priv.get_verifying_key().to_string("compressed")
+            vkey = secp_priv.public_key.format(compressed=True)
             key_clazz = SuiKeyPairSECP256K1
             validation_str = "ValidateAndGetSecp256k1Key"
 
         case SignatureScheme.SECP256R1:
-            bip32_ctx = bip_utils.Bip32Slip10Nist256p1.FromSeedAndPath(
-                seed_bytes, derv_path or SECP256R1_DEFAULT_KEYPATH
-            )
             # 1. Private, or signer, key
-            secp_priv = ecdsa.SigningKey.from_string(bip32_ctx.PrivateKey().Raw().ToBytes(), curve=ecdsa.NIST256p)
-            pkey = secp_priv.to_string()
+            pkey = derive(bip_utils.Bip32Slip10Nist256p1, seed_bytes, derv_path or SECP256R1_DEFAULT_KEYPATH)
+            secp_priv = ec.derive_private_key(int.from_bytes(pkey, "big"), ec.SECP256R1())
             # 2. Public, or verifier, key
-            vkey = secp_priv.get_verifying_key().to_string("compressed")
+            vkey = secp_priv.public_key().public_bytes(Encoding.X962, PublicFormat.CompressedPoint)
             key_clazz = SuiKeyPairSECP256R1
             validation_str = "ValidateAndGetNist256p1Key"
         case _:
@@ -675,27 +849,55 @@ def create_new_keypair(
     return mnemonic_phrase, key_clazz(pkey)
 
 
+create_new_keypair.cache_clear = _derive_cached.cache_clear
+
+
+_KEYSTRING_DISPATCH: dict[int, Callable[[bytes], KeyPair]] = {
+    SignatureScheme.ED25519.value: SuiKeyPairED25519.from_bytes,
+    SignatureScheme.SECP256K1.value: SuiKeyPairSECP256K1.from_bytes,
+    SignatureScheme.SECP256R1.value: SuiKeyPairSECP256R1.from_bytes,
+}
+"""Keypair constructor by scheme flag byte."""
+
+
+def _keypair_from_raw(raw: bytes) -> KeyPair:
+    """Scheme prefixed private key bytes to keypair."""
+    try:
+        keypair_from = _KEYSTRING_DISPATCH[raw[0]]
+    except KeyError as kexc:
+        raise NotImplementedError from kexc
+    return keypair_from(raw[1:])
+
+
+@functools.lru_cache(maxsize=1024)
+def _keypair_from_keystring(keystring: str) -> KeyPair:
+    """Memoized keystring parse, see keypair_from_keystring."""
+    addy_bytes = base64.b64decode(keystring, validate=True)
+    if len(addy_bytes) != SCHEME_PRIVATE_KEY_BYTE_LEN:
+        raise SuiInvalidKeystringLength(len(addy_bytes))
+    return _keypair_from_raw(addy_bytes)
+
+
+@versionchanged(version="0.25.1", reason="Results are cached, use keypair_from_keystring.cache_clear() to purge")
 def keypair_from_keystring(keystring: str) -> KeyPair:
     """keypair_from_keystring Parse keystring to keypair.
 
+    Resulting keypairs are cached by keystring (up to 1024 entries) and shared between
+    callers. As the cache holds private key material, call `keypair_from_keystring.cache_clear()`
+    to purge it when keys are no longer needed.
+
     :param keystring: base64 keystring
     :type keystring: str
-    :raises SuiInvalidKeystringLength: If invalid keypair string length
+    :raises binascii.Error: If keystring is not valid base64
+    :raises SuiInvalidKeystringLength: If the decoded keystring is not scheme flag plus 32 bytes
     :raises NotImplementedError: If invalid keytype signature in string
     :return: keypair derived from keystring
     :rtype: KeyPair
     """
-    if len(keystring) != SUI_KEYPAIR_LEN:
-        raise SuiInvalidKeystringLength(len(keystring))
-    addy_bytes = base64.b64decode(keystring)
-    match addy_bytes[0]:
-        case SignatureScheme.ED25519:
-            return SuiKeyPairED25519.from_bytes(addy_bytes[1:])
-        case SignatureScheme.SECP256K1:
-            return SuiKeyPairSECP256K1.from_bytes(addy_bytes[1:])
-        case SignatureScheme.SECP256R1:
-            return SuiKeyPairSECP256R1.from_bytes(addy_bytes[1:])
-    raise NotImplementedError
+    return _keypair_from_keystring(keystring)
+
+
+keypair_from_keystring.cache_clear = _keypair_from_keystring.cache_clear
 
 
 def create_new_address(
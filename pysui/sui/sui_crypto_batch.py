@@ -0,0 +1,91 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Sui bulk keypair creation and signature verification."""
+
+from deprecated.sphinx import versionadded
+from nacl.bindings import crypto_sign_BYTES, crypto_sign_open
+from nacl.exceptions import BadSignatureError
+
+from pysui.abstracts import SignatureScheme
+from pysui.sui.sui_crypto import SuiKeyPair, SuiPublicKey, create_new_keypair
+
+
+@versionadded(version="0.25.1", reason="Bulk keypair creation")
+def create_new_keypairs(
+    count: int, scheme: SignatureScheme = SignatureScheme.ED25519, derv_path: str = None
+) -> list[tuple[str, SuiKeyPair]]:
+    """create_new_keypairs Generate multiple new keypairs, each from a new mnemonic phrase.
+
+    :param count: The number of keypairs to generate
+    :type count: int
+    :param scheme: One of ED25519, SECP256K1 or SECP256R1 key type, defaults to SignatureScheme.ED25519
+    :type scheme: SignatureScheme, optional
+    :param derv_path: derivation path coinciding with key type, defaults to None
+    :type derv_path: str, optional
+    :return: mnemonic words and new keypair for each generated key
+    :rtype: list[tuple[str, SuiKeyPair]]
+    """
+    return [create_new_keypair(scheme, "", derv_path) for _ in range(count)]
+
+
+@versionadded(version="0.25.1", reason="Bulk signature verification")
+def verify_ed25519_batch(items: list[tuple[bytes, bytes, bytes]]) -> list[bool]:
+    """verify_ed25519_batch Verify multiple ED25519 signatures.
+
+    Verification calls libsodium directly for each item, avoiding the construction
+    of intermediate key objects. Signatures that are not exactly 64 bytes fail verification.
+
+    :param items: List of (public key bytes, message bytes, signature bytes) tuples
+    :type items: list[tuple[bytes, bytes, bytes]]
+    :return: Verification result for each item, in order
+    :rtype: list[bool]
+    """
+    results: list[bool] = []
+    for pub_key, message, signature in items:
+        # crypto_sign_open splits signature + message at 64 bytes, other lengths would shift
+        # message bytes into (or out of) the signature
+        if len(signature) != crypto_sign_BYTES:
+            results.append(False)
+            continue
+        try:
+            crypto_sign_open(signature + message, pub_key)
+            results.append(True)
+        except (BadSignatureError, ValueError):
+            results.append(False)
+    return results
+
+
+@versionadded(version="0.25.1", reason="Bulk signature verification")
+def verify_signatures(items: list[tuple[SuiPublicKey, bytes, bytes]]) -> list[bool]:
+    """verify_signatures Verify multiple signatures of mixed key schemes.
+
+    ED25519 items are verified together through `verify_ed25519_batch`.
+
+    :param items: List of (public key, message bytes, signature bytes) tuples
+    :type items: list[tuple[SuiPublicKey, bytes, bytes]]
+    :return: Verification result for each item, in order
+    :rtype: list[bool]
+    """
+    results: list[bool] = [False] * len(items)
+    ed_indexes: list[int] = []
+    ed_items: list[tuple[bytes, bytes, bytes]] = []
+    for index, (pub_key, message, signature) in enumerate(items):
+        if pub_key.scheme == SignatureScheme.ED25519:
+            ed_indexes.append(index)
+            ed_items.append((pub_key.key_bytes, message, signature))
+        else:
+            results[index] = pub_key.verify(message, signature)
+    for index, result in zip(ed_indexes, verify_ed25519_batch(ed_items)):
+        results[index] = result
+    return results
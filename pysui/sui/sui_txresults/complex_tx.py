@@ -135,7 +135,6 @@ class Transaction(SuiTxReturnType, DataClassJsonMixin):
             elif isinstance(sig, dict):
                 hydrate.append(MultiSig.from_dict(sig))
             else:
-                print(f"No idea {sig}")
                 hydrate.append(sig)
         self.tx_signatures = hydrate
 
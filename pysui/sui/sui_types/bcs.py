@@ -13,37 +13,61 @@
 
 """Sui BCS Types."""
 
-import binascii
 import base64
+import struct
 from typing import Any, Union
-from functools import reduce
+from functools import lru_cache
+import base58
 import canoser
 from deprecated.sphinx import versionadded, versionchanged
 from pysui.sui.sui_txresults.single_tx import ObjectRead
 
 from pysui.sui.sui_types.address import SuiAddress
-from pysui.sui.sui_utils import hexstring_to_list, b58str_to_list
+from pysui.sui.sui_types.bcs_compiled import CompiledEnum, CompiledStruct, read_uleb128, write_uleb128
 from pysui.sui.sui_txresults.common import GenericRef
 
 _ADDRESS_LENGTH: int = 32
 _DIGEST_LENGTH: int = 32
+_DIGEST_LENGTH_PREFIX: bytes = canoser.Uint32.serialize_uint32_as_uleb128(_DIGEST_LENGTH)
+_U64: struct.Struct = struct.Struct("<Q")
+_U64_U64: struct.Struct = struct.Struct("<QQ")
+# ObjectID, SequenceNumber, length prefixed ObjectDigest
+_OBJECT_REFERENCE_LENGTH: int = _ADDRESS_LENGTH + _U64.size + len(_DIGEST_LENGTH_PREFIX) + _DIGEST_LENGTH
 
 TYPETAG_STRUCT_DEPTH_MAX: int = 16
 TYPETAG_VECTOR_DEPTH_MAX: int = 16
 
 
-class Address(canoser.Struct):
-    """Address Represents a Sui Address or ObjectID as list of ints."""
+@versionchanged(version="0.25.1", reason="Address held as bytes instead of list of ints")
+class Address(CompiledStruct):
+    """Address Represents a Sui Address or ObjectID as 32 bytes."""
 
-    _fields = [("Address", canoser.ArrayT(canoser.Uint8, _ADDRESS_LENGTH, False))]
+    _fields = [("Address", canoser.BytesT(_ADDRESS_LENGTH, False))]
+
+    def __init__(self, address: Union[bytes, bytearray, list[int]]) -> None:
+        """__init__ Initialize from address bytes.
+
+        :param address: The 32 address bytes, a bytearray or list of ints is converted to bytes
+        :type address: Union[bytes, bytearray, list[int]]
+        """
+        super().__init__(address if isinstance(address, bytes) else bytes(address))
+
+    def _encode_into(self, out: bytearray) -> None:
+        """_encode_into Write the raw (unprefixed) address bytes."""
+        out += self.Address  # pylint: disable=no-member
+
+    @classmethod
+    def decode(cls, cursor: canoser.Cursor) -> "Address":
+        """decode Override canoser decoding with a single fixed length read."""
+        return cls(cursor.read_bytes(_ADDRESS_LENGTH))
 
     def to_str(self) -> str:
         """."""
-        return binascii.hexlify(bytes(getattr(self, "Address"))).decode()
+        return self.Address.hex()  # pylint: disable=no-member
 
     def to_address_str(self) -> str:
         """."""
-        return f"0x{self.to_str()}"
+        return "0x" + self.Address.hex()  # pylint: disable=no-member
 
     def to_sui_address(self) -> SuiAddress:
         """."""
@@ -52,32 +76,77 @@ class Address(canoser.Struct):
     @classmethod
     def from_sui_address(cls, indata: SuiAddress) -> "Address":
         """."""
-        return cls(hexstring_to_list(indata.address))
+        return cls.from_str(indata.address)
 
     @classmethod
+    @versionchanged(version="0.25.1", reason="Returns shared instances for well known system addresses")
     def from_str(cls, indata: str) -> "Address":
-        """."""
-        return cls(hexstring_to_list(indata))
+        """Address from hex string, with or without 0x prefix, zero filled to 32 bytes.
 
+        Well known system addresses (e.g. 0x2, 0x6) return a shared instance that must not be mutated.
+        """
+        if indata.startswith(("0x", "0X")):
+            indata = indata[2:]
+        indata = indata.zfill(_ADDRESS_LENGTH * 2)
+        if cls is Address:
+            well_known = _WELL_KNOWN.get(indata)
+            if well_known is not None:
+                return well_known
+        return cls(bytes.fromhex(indata))
+
+
+# Shared instances of the system addresses, keyed by zero filled hex without 0x prefix
+_WELL_KNOWN: dict[str, Address] = {
+    hex_str: Address(bytes.fromhex(hex_str))
+    for hex_str in (f"{value:0{_ADDRESS_LENGTH * 2}x}" for value in (0x0, 0x1, 0x2, 0x3, 0x5, 0x6, 0x403))
+}
 
-class Digest(canoser.Struct):
-    """Digest represents a transaction or object base58 value as list of ints."""
 
-    _fields = [("Digest", canoser.ArrayT(canoser.Uint8, _DIGEST_LENGTH))]
+@versionchanged(version="0.25.1", reason="Digest held as bytes instead of list of ints")
+class Digest(CompiledStruct):
+    """Digest represents a transaction or object base58 value as 32 bytes."""
+
+    _fields = [("Digest", canoser.BytesT(_DIGEST_LENGTH))]
+
+    def __init__(self, digest: Union[bytes, bytearray, list[int]]) -> None:
+        """__init__ Initialize from digest bytes.
+
+        :param digest: The 32 digest bytes, a bytearray or list of ints is converted to bytes
+        :type digest: Union[bytes, bytearray, list[int]]
+        """
+        super().__init__(digest if isinstance(digest, bytes) else bytes(digest))
+
+    def _encode_into(self, out: bytearray) -> None:
+        """_encode_into Write the length prefixed digest bytes."""
+        out += _DIGEST_LENGTH_PREFIX
+        out += self.Digest  # pylint: disable=no-member
+
+    @classmethod
+    def decode(cls, cursor: canoser.Cursor) -> "Digest":
+        """decode Override canoser decoding with a single fixed length read."""
+        size = canoser.Uint32.parse_uint32_from_uleb128(cursor)
+        if size != _DIGEST_LENGTH:
+            raise TypeError(f"{size} is not equal to predefined value: {_DIGEST_LENGTH}")
+        return cls(cursor.read_bytes(_DIGEST_LENGTH))
 
     @classmethod
     def from_str(cls, indata: str) -> "Digest":
         """Digest from base58 string."""
-        return cls(b58str_to_list(indata))
+        try:
+            decode_bytes = base58.b58decode(indata)
+        # Fall back if invalid base58 str
+        except ValueError:
+            decode_bytes = base64.b64decode(indata)
+        return cls(decode_bytes)
 
     @classmethod
     @versionadded(version="0.17.0", reason="Direct from bytes construction")
     def from_bytes(cls, indata: bytes) -> "Digest":
         """Digest from bytes."""
-        return cls(list(indata))
+        return cls(indata)
 
 
-class BuilderArg(canoser.RustEnum):
+class BuilderArg(CompiledEnum):
     """BuilderArg objects are generated in the TransactionBuilder."""
 
     _enums = [("Object", Address), ("Pure", [canoser.Uint8]), ("ForcedNonUniquePure", None)]
@@ -89,7 +158,18 @@ class BuilderArg(canoser.RustEnum):
         return id(self)
 
 
-class ObjectReference(canoser.Struct):
+@lru_cache(maxsize=4096)
+def _make_ref(cls: type, object_id: str, version: int, digest: str) -> "ObjectReference":
+    """_make_ref Build, and cache, an object reference from its string fields.
+
+    Recurring references (e.g. gas coins across a batch) skip the hex and base58 parsing. Cached references
+    are shared and must not be mutated.
+    """
+    return cls(Address.from_str(object_id), version, Digest.from_str(digest))
+
+
+@versionchanged(version="0.25.1", reason="Fixed size encoding written and read in one pass")
+class ObjectReference(CompiledStruct):
     """ObjectReference represents an object by it's objects reference fields."""
 
     _fields = [
@@ -98,7 +178,30 @@ class ObjectReference(canoser.Struct):
         ("ObjectDigest", Digest),
     ]
 
+    def _encode_into(self, out: bytearray) -> None:
+        """_encode_into Write the address, precompiled u64 and length prefixed digest directly."""
+        # pylint: disable=no-member
+        out += self.ObjectID.Address
+        out += _U64.pack(self.SequenceNumber)
+        out += _DIGEST_LENGTH_PREFIX
+        out += self.ObjectDigest.Digest
+
     @classmethod
+    def decode(cls, cursor: canoser.Cursor) -> "ObjectReference":
+        """decode Read the fixed size reference with a single read."""
+        data = cursor.read_bytes(_OBJECT_REFERENCE_LENGTH)
+        digest_at = _ADDRESS_LENGTH + _U64.size
+        if data[digest_at] != _DIGEST_LENGTH:
+            raise TypeError(f"{data[digest_at]} is not equal to predefined value: {_DIGEST_LENGTH}")
+        ret = cls.__new__(cls)
+        values = ret.__dict__
+        values["ObjectID"] = Address(data[:_ADDRESS_LENGTH])
+        values["SequenceNumber"] = _U64.unpack_from(data, _ADDRESS_LENGTH)[0]
+        values["ObjectDigest"] = Digest(data[digest_at + 1 :])
+        return ret
+
+    @classmethod
+    @versionchanged(version="0.25.1", reason="Returns shared, cached, instances for recurring references")
     def from_generic_ref(cls, indata: GenericRef) -> "ObjectReference":
         """from_generic_ref init construct with GenericRef from ObjectRead structure.
 
@@ -108,11 +211,11 @@ class ObjectReference(canoser.Struct):
         :rtype: SharedObjectReference
         """
         if isinstance(indata, GenericRef):
-            return cls(Address.from_str(indata.object_id), int(indata.version), Digest.from_str(indata.digest))
+            return _make_ref(cls, indata.object_id, int(indata.version), indata.digest)
         raise ValueError(f"{indata} is not valid")
 
 
-class SharedObjectReference(canoser.Struct):
+class SharedObjectReference(CompiledStruct):
     """SharedObjectReference represents a shared object by it's objects reference fields."""
 
     _fields = [
@@ -153,6 +256,18 @@ class Uint256(canoser.int_type.IntType):
         """
         return value.to_bytes(32, byteorder="little", signed=False)
 
+    @classmethod
+    @versionadded(version="0.25.1", reason="Direct decode to match encode")
+    def decode(cls, cursor: canoser.Cursor) -> int:
+        """decode Override canoser.int_type.IntType to read the 32 bytes as a python int.
+
+        :param cursor: The canoser cursor positioned at the value
+        :type cursor: canoser.Cursor
+        :return: The decoded python int
+        :rtype: int
+        """
+        return int.from_bytes(cursor.read_bytes(32), byteorder="little", signed=False)
+
 
 U8 = canoser.Uint8
 U16 = canoser.Uint16
@@ -203,11 +318,13 @@ class OptionalU256(canoser.RustOptional):
     _type = U256
 
 
-class TypeTag(canoser.RustEnum):
+class TypeTag(CompiledEnum):
     """TypeTag enum for move call type_arguments."""
 
     _LCASE_SCALARS: list[str] = ["bool", "u8", "u16", "u32", "u64", "u128", "u256"]
     _UCASE_SCALARS: list[str] = ["Bool", "U8", "U16", "U32", "U64", "uU28", "U256"]
+    _FORWARD_REFERENCES: tuple[int, ...] = (6, 7)
+    _frozen: bool = False
 
     _enums = [
         ("Bool", None),
@@ -256,19 +373,58 @@ class TypeTag(canoser.RustEnum):
         raise ValueError(f"{value} not a recognized TypeTag")
 
     @classmethod
+    @versionchanged(version="0.25.1", reason="Replaces the frozen enum tuple, raises once TypeTag is frozen")
     def update_value_at(cls, index: int, value: Any):
-        """update_value_at Updates the enum list.
+        """update_value_at Updates the enum value type at index.
+
+        Only used to resolve the Vector and Struct forward references while this module loads,
+        TypeTag is frozen once both are set.
 
         :param index: Index of enum
         :type index: int
         :param value: The BCS type value to insert at index
         :type value: Any
+        :raises TypeError: If called after TypeTag is frozen
         """
-        cls._enums[index] = (cls._enums[index][0], value)
+        if cls._frozen:
+            raise TypeError(f"{cls.__name__} enums are frozen")
+        enums = list(cls._enums)
+        enums[index] = (enums[index][0], value)
+        cls._enums = tuple(enums)
+        cls._compile_variants()
+        cls._frozen = all(cls._enums[ref][1] is not None for ref in cls._FORWARD_REFERENCES)
+
+
+@lru_cache(maxsize=1024)
+def _parse_type_str(type_str: str) -> tuple[tuple[bytes, str, str], ...]:
+    """_parse_type_str Parse a, possibly nested, type string into the components of each struct.
+
+    Results are cached as recurring type strings (e.g. 0x2::sui::SUI) always parse the same.
+
+    :param type_str: Type string (e.g. 0x2::coin::Coin<0x2::sui::SUI>)
+    :type type_str: str
+    :raises ValueError: If nesting exceeds TYPETAG_STRUCT_DEPTH_MAX
+    :return: The (address bytes, module, name) of each struct, outermost first
+    :rtype: tuple[tuple[bytes, str, str], ...]
+    """
+    inner_count = type_str.count("<")
+    if inner_count > TYPETAG_STRUCT_DEPTH_MAX:
+        raise ValueError(
+            f"type is constrained to max {TYPETAG_STRUCT_DEPTH_MAX} depth. Found {inner_count} for {type_str}"
+        )
+    multi_struct = type_str.split("<")
+    if inner_count:
+        multi_struct[-1] = multi_struct[-1][:-inner_count]
+    components = []
+    for item in multi_struct:
+        split_type = item.split("::")
+        components.append((Address.from_str(split_type[0]).Address, split_type[1], split_type[2]))
+    return tuple(components)
 
 
 @versionchanged(version="0.17.1", reason="Fixed nested types.")
-class StructTag(canoser.Struct):
+@versionchanged(version="0.25.1", reason="Type string parsing is cached.")
+class StructTag(CompiledStruct):
     """StructTag represents a type value (e.g. 0x2::sui::SUI) in BCS when used in MoveCall."""
 
     _fields = [("address", Address), ("module", str), ("name", str), ("type_parameters", [TypeTag])]
@@ -282,26 +438,10 @@ class StructTag(canoser.Struct):
         :return: Instance of StructTag
         :rtype: StructTag
         """
-
-        def _reducer(accum: TypeTag, item: str) -> TypeTag:
-            """Accumulate nested type tags."""
-            new_s = item.split("::")
-            if not accum:
-                return TypeTag("Struct", cls(Address.from_str(new_s[0]), new_s[1], new_s[2], []))
-            return TypeTag("Struct", cls(Address.from_str(new_s[0]), new_s[1], new_s[2], [accum]))
-
-        inner_count = type_str.count("<")
-        if inner_count:
-            if inner_count > TYPETAG_STRUCT_DEPTH_MAX:
-                raise ValueError(
-                    f"type is constrained to max {TYPETAG_STRUCT_DEPTH_MAX} depth. Found {inner_count} for {type_str}"
-                )
-            multi_struct = type_str.split("<")
-            last_pos = len(multi_struct) - 1
-            multi_struct[last_pos] = multi_struct[last_pos][:-inner_count]
-            return reduce(_reducer, multi_struct[::-1], None).value
-        split_type = type_str.split("::")
-        return cls(Address.from_str(split_type[0]), split_type[1], split_type[2], [])
+        struct_tag = None
+        for address, module, name in reversed(_parse_type_str(type_str)):
+            struct_tag = cls(Address(address), module, name, [TypeTag("Struct", struct_tag)] if struct_tag else [])
+        return struct_tag
 
 
 # Overcome forward reference at init time with these injections
@@ -309,13 +449,13 @@ TypeTag.update_value_at(6, [TypeTag])
 TypeTag.update_value_at(7, StructTag)
 
 
-class ObjectArg(canoser.RustEnum):
+class ObjectArg(CompiledEnum):
     """ObjectArg enum for type of object and it's reference data when used in MoveCall."""
 
     _enums = [("ImmOrOwnedObject", ObjectReference), ("SharedObject", SharedObjectReference)]
 
 
-class CallArg(canoser.RustEnum):
+class CallArg(CompiledEnum):
     """CallArg represents an argument (parameters) of a MoveCall.
 
     Pure type is for scalares, or native, values.
@@ -324,7 +464,8 @@ class CallArg(canoser.RustEnum):
     _enums = [("Pure", [canoser.Uint8]), ("Object", ObjectArg)]
 
 
-class GasData(canoser.Struct):
+@versionchanged(version="0.25.1", reason="Price and Budget written and read with one precompiled struct")
+class GasData(CompiledStruct):
     """."""
 
     _fields = [
@@ -334,8 +475,24 @@ class GasData(canoser.Struct):
         ("Budget", canoser.Uint64),
     ]
 
+    def _encode_into(self, out: bytearray) -> None:
+        """_encode_into Write Payment and Owner, then Price and Budget with one pack."""
+        for name, write, _ in self._compiled[:2]:
+            write(getattr(self, name), out)
+        out += _U64_U64.pack(self.Price, self.Budget)  # pylint: disable=no-member
+
+    @classmethod
+    def decode(cls, cursor: canoser.Cursor) -> "GasData":
+        """decode Read Payment and Owner, then Price and Budget with one unpack."""
+        ret = cls.__new__(cls)
+        values = ret.__dict__
+        for name, _, dec in cls._compiled[:2]:
+            values[name] = dec(cursor)
+        values["Price"], values["Budget"] = _U64_U64.unpack(cursor.read_bytes(_U64_U64.size))
+        return ret
+
 
-class Argument(canoser.RustEnum):
+class Argument(CompiledEnum):
     """."""
 
     _enums = [
@@ -357,7 +514,7 @@ class OptionalTypeTag(canoser.RustOptional):
     #     print(value)
 
 
-class ProgrammableMoveCall(canoser.Struct):
+class ProgrammableMoveCall(CompiledStruct):
     """A call to either an entry or a public Move function."""
 
     _fields = [
@@ -374,48 +531,98 @@ class ProgrammableMoveCall(canoser.Struct):
     ]
 
 
-class TransferObjects(canoser.Struct):
+class TransferObjects(CompiledStruct):
     """It sends n-objects to the specified address."""
 
     _fields = [("Objects", [Argument]), ("Address", Argument)]
 
 
-class SplitCoin(canoser.Struct):
+class SplitCoin(CompiledStruct):
     """It splits off some amount into a new coin."""
 
     _fields = [("FromCoin", Argument), ("Amount", [Argument])]
 
 
-class MergeCoins(canoser.Struct):
+class MergeCoins(CompiledStruct):
     """It merges n-coins into the first coin."""
 
     _fields = [("ToCoin", Argument), ("FromCoins", [Argument])]
 
 
-class Publish(canoser.Struct):
+class _ModulesT:
+    """_ModulesT canoser field type for a vector of byte vectors, such as compiled move modules.
+
+    Each module is copied as one block instead of canoser encoding and decoding it one Uint8 at a time.
+    Modules are lists of ints (bytes are also accepted when encoding) and decode as lists of ints.
+    """
+
+    @classmethod
+    def _encode_into(cls, modules: list[Union[list[int], bytes]], out: bytearray) -> None:
+        """_encode_into Write the ULEB128 count followed by each ULEB128 length prefixed module into out."""
+        write_uleb128(len(modules), out)
+        for module in modules:
+            write_uleb128(len(module), out)
+            out.extend(module)
+
+    @classmethod
+    def encode(cls, modules: list[Union[list[int], bytes]]) -> bytes:
+        """encode Encode modules into a single output buffer."""
+        out = bytearray()
+        cls._encode_into(modules, out)
+        return bytes(out)
+
+    @classmethod
+    def decode(cls, cursor: canoser.Cursor) -> list[list[int]]:
+        """decode Read each module with a single read of its length."""
+        return [list(cursor.read_bytes(read_uleb128(cursor))) for _ in range(read_uleb128(cursor))]
+
+    @classmethod
+    def check_value(cls, modules: list[Union[list[int], bytes]]) -> None:
+        """check_value Validate modules are a list of byte values."""
+        if not isinstance(modules, list):
+            raise TypeError(f"{modules} is not a list.")
+        for module in modules:
+            if isinstance(module, bytes):
+                continue
+            if not isinstance(module, list):
+                raise TypeError(f"{module} is not a list or bytes.")
+            try:
+                bytes(module)
+            except ValueError as exc:
+                raise TypeError(f"module has values outside of u8 range: {exc}") from exc
+
+    @classmethod
+    def to_json_serializable(cls, modules: list[Union[list[int], bytes]]) -> list[str]:
+        """to_json_serializable Each module as a hex string."""
+        return [bytes(module).hex() for module in modules]
+
+
+@versionchanged(version="0.25.1", reason="Modules encoded and decoded as byte blocks")
+class Publish(CompiledStruct):
     """Publish represents a sui_publish structure."""
 
-    _fields = [("Modules", [[canoser.Uint8]]), ("Dependents", [Address])]
+    _fields = [("Modules", _ModulesT), ("Dependents", [Address])]
 
 
-class MakeMoveVec(canoser.Struct):
+class MakeMoveVec(CompiledStruct):
     """Given n-values of the same type, it constructs a vector."""
 
     _fields = [("TypeTag", OptionalTypeTag), ("Vector", [Argument])]
 
 
-class Upgrade(canoser.Struct):
+@versionchanged(version="0.25.1", reason="Modules encoded and decoded as byte blocks")
+class Upgrade(CompiledStruct):
     """Upgrade an existing move package onchain."""
 
     _fields = [
-        ("Modules", [[canoser.Uint8]]),
+        ("Modules", _ModulesT),
         ("Dependents", [Address]),
         ("Package", Address),
         ("UpgradeTicket", Argument),
     ]
 
 
-class Command(canoser.RustEnum):
+class Command(CompiledEnum):
     """."""
 
     _enums = [
@@ -429,13 +636,13 @@ class Command(canoser.RustEnum):
     ]
 
 
-class ProgrammableTransaction(canoser.Struct):
+class ProgrammableTransaction(CompiledStruct):
     """."""
 
     _fields = [("Inputs", [CallArg]), ("Command", [Command])]
 
 
-class TransactionKind(canoser.RustEnum):
+class TransactionKind(CompiledEnum):
     """TransactionKind is enumeration of transaction kind.
 
     Deserialization (from_bytes) should only called if attempting to deserialize from
@@ -458,13 +665,13 @@ class TransactionKind(canoser.RustEnum):
         return cls.deserialize(in_data)
 
 
-class TransactionExpiration(canoser.RustEnum):
+class TransactionExpiration(CompiledEnum):
     """."""
 
     _enums = [("None", None), ("Epoch", canoser.Uint64)]
 
 
-class TransactionDataV1(canoser.Struct):
+class TransactionDataV1(CompiledStruct):
     """."""
 
     _fields = [
@@ -475,7 +682,7 @@ class TransactionDataV1(canoser.Struct):
     ]
 
 
-class TransactionData(canoser.RustEnum):
+class TransactionData(CompiledEnum):
     """TransactionData is enumeration of transaction kind.
 
     Deserialization (from_bytes) should only called if attempting to deserialize from
@@ -485,6 +692,7 @@ class TransactionData(canoser.RustEnum):
     _enums = [("V1", TransactionDataV1)]
 
     @classmethod
+    @versionchanged(version="0.25.1", reason="Fixed accepting an index one past the last variant")
     def variant_for_index(cls, index: int) -> Union[tuple[str, canoser.RustEnum], IndexError]:
         """variant_for_index returns the enum name and reference tuple from specific index.
 
@@ -494,8 +702,8 @@ class TransactionData(canoser.RustEnum):
         :return: The name,value tuple of the enum index
         :rtype: Union[tuple[str, canoser.RustEnum], ValueError]
         """
-        if index > len(cls._enums):
-            raise IndexError(f"{cls.__name__} has only {len(cls._enums)} and index requested is greater {index}")
+        if index >= len(cls._enums):
+            raise IndexError(f"{cls.__name__} has only {len(cls._enums)} and index requested is {index}")
         return cls._enums[index]
 
     @classmethod
@@ -505,28 +713,28 @@ class TransactionData(canoser.RustEnum):
 
 
 @versionadded(version="0.20.4", reason="Added to support in-code MultiSig signing.")
-class MsPublicKey(canoser.Struct):
+class MsPublicKey(CompiledStruct):
     """Represents signing PublicKeys for serialization."""
 
     _fields = [("PublicKey", [U8]), ("Weight", U8)]
 
 
 @versionadded(version="0.20.4", reason="Added to support in-code MultiSig signing.")
-class MsRoaring(canoser.Struct):
+class MsRoaring(CompiledStruct):
     """Represents signing PublicKeys indexes for serialization."""
 
     _fields = [("RoaringBitmap", [U8])]
 
 
 @versionadded(version="0.20.4", reason="Added to support in-code MultiSig signing.")
-class MsCompressedSig(canoser.Struct):
+class MsCompressedSig(CompiledStruct):
     """Represents compressed individual signed messages for serialization."""
 
     _fields = [("Sig", [U8, 65, False])]
 
 
 @versionadded(version="0.20.4", reason="Added to support in-code MultiSig signing.")
-class MultiSignature(canoser.Struct):
+class MultiSignature(CompiledStruct):
     """BCS representation of a MultiSig signature for executions."""
 
     _fields = [
@@ -0,0 +1,314 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Sui BCS compiled structure and enum support.
+
+Field codecs are resolved once per class, when it is created, rather than on every encode and decode.
+"""
+
+import struct
+from typing import Any, Callable, Union
+import canoser
+
+
+def write_uleb128(value: int, out: bytearray) -> None:
+    """write_uleb128 Append the ULEB128 encoding of value to out, unrolled for one and two byte lengths."""
+    if value < 0x80:
+        out.append(value)
+        return
+    if value < 0x4000:
+        out.append((value & 0x7F) | 0x80)
+        out.append(value >> 7)
+        return
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_uleb128(cursor: canoser.Cursor) -> int:
+    """read_uleb128 Read a ULEB128 length, taking single byte lengths directly from the cursor buffer."""
+    offset = cursor.offset
+    if offset < cursor.buffer_len:
+        byte = cursor.buffer[offset]
+        if byte < 0x80:
+            cursor.offset = offset + 1
+            return byte
+    return canoser.Uint32.parse_uint32_from_uleb128(cursor)
+
+
+def _bytes_writer(enc: Callable[[Any], bytes]) -> Callable[[Any, bytearray], None]:
+    """_bytes_writer Adapt a canoser bytes returning encoder to write into the output buffer."""
+
+    def _write(value: Any, out: bytearray) -> None:
+        out += enc(value)
+
+    return _write
+
+
+def _vector_codec(item_write: Callable[[Any, bytearray], None], item_dec: Callable[[canoser.Cursor], Any]) -> tuple:
+    """_vector_codec Build the writer and decoder of a ULEB128 length prefixed vector of items."""
+
+    def _write(arr: list, out: bytearray) -> None:
+        write_uleb128(len(arr), out)
+        for item in arr:
+            item_write(item, out)
+
+    def _decode(cursor: canoser.Cursor) -> list:
+        return [item_dec(cursor) for _ in range(read_uleb128(cursor))]
+
+    return _write, _decode
+
+
+def _byte_vector_codec(fixed_len: Union[int, None], encode_len: bool) -> tuple:
+    """_byte_vector_codec Build the writer and decoder of a vector of u8 copied as one block of bytes."""
+
+    def _write(arr: list[int], out: bytearray) -> None:
+        if fixed_len is not None and len(arr) != fixed_len:
+            raise TypeError(f"{len(arr)} is not equal to predefined value: {fixed_len}")
+        if encode_len:
+            write_uleb128(len(arr), out)
+        out += bytes(arr)
+
+    def _decode(cursor: canoser.Cursor) -> list[int]:
+        if not encode_len:
+            return list(cursor.read_bytes(fixed_len))
+        size = read_uleb128(cursor)
+        if fixed_len is not None and size != fixed_len:
+            raise TypeError(f"{size} is not equal to predefined value: {fixed_len}")
+        return list(cursor.read_bytes(size))
+
+    return _write, _decode
+
+
+def _optional_codec(mtype: type[canoser.RustOptional]) -> tuple:
+    """_optional_codec Build the writer of a canoser.RustOptional writing its value into the same buffer."""
+    # canoser.RustOptional subclasses declare their value type in _type
+    value_write, _ = _field_codec(canoser.types.type_mapping(mtype._type))  # pylint: disable=protected-access
+
+    def _write(optional: canoser.RustOptional, out: bytearray) -> None:
+        if optional.value is None:
+            out.append(0)
+        else:
+            out.append(1)
+            value_write(optional.value, out)
+
+    return _write, mtype.decode
+
+
+def _packed_codec(fmt: str) -> tuple:
+    """_packed_codec Build the writer and decoder of a fixed size int from a precompiled struct format."""
+    packer = struct.Struct(fmt)
+    pack = packer.pack
+    size = packer.size
+    unpack = packer.unpack
+
+    def _write(value: int, out: bytearray) -> None:
+        out += pack(value)
+
+    def _decode(cursor: canoser.Cursor) -> int:
+        return unpack(cursor.read_bytes(size))[0]
+
+    return _write, _decode
+
+
+_BOOL_VALUES: dict[bytes, bool] = {b"\x00": False, b"\x01": True}
+
+
+def _bool_write(value: bool, out: bytearray) -> None:
+    """_bool_write Write a BCS bool."""
+    out.append(1 if value else 0)
+
+
+def _bool_decode(cursor: canoser.Cursor) -> bool:
+    """_bool_decode Decode a BCS bool, rejecting values other than 0 or 1."""
+    try:
+        return _BOOL_VALUES[cursor.read_bytes(1)]
+    except KeyError:
+        raise TypeError("bool should be 0 or 1.") from None
+
+
+def _u128_write(value: int, out: bytearray) -> None:
+    """_u128_write Write a BCS u128."""
+    out += value.to_bytes(16, byteorder="little", signed=False)
+
+
+def _u128_decode(cursor: canoser.Cursor) -> int:
+    """_u128_decode Decode a BCS u128."""
+    return int.from_bytes(cursor.read_bytes(16), byteorder="little", signed=False)
+
+
+def _str_write(value: str, out: bytearray) -> None:
+    """_str_write Write a ULEB128 length prefixed utf-8 string."""
+    utf8 = value.encode("utf-8")
+    write_uleb128(len(utf8), out)
+    out += utf8
+
+
+def _str_decode(cursor: canoser.Cursor) -> str:
+    """_str_decode Decode a ULEB128 length prefixed utf-8 string."""
+    return str(cursor.read_bytes(read_uleb128(cursor)), encoding="utf-8")
+
+
+# Inline (writer, decoder) of primitive canoser types, skipping canoser's classmethod dispatch
+_PRIM_CODECS: dict[type, tuple] = {
+    canoser.BoolT: (_bool_write, _bool_decode),
+    canoser.Uint8: _packed_codec("<B"),
+    canoser.Uint16: _packed_codec("<H"),
+    canoser.Uint32: _packed_codec("<L"),
+    canoser.Uint64: _packed_codec("<Q"),
+    canoser.Uint128: (_u128_write, _u128_decode),
+    canoser.StrT: (_str_write, _str_decode),
+}
+
+
+def _field_codec(mtype: Any) -> tuple:
+    """_field_codec Resolve the (writer, decoder) of a canoser field type.
+
+    A writer appends the encoding of a value to a shared output bytearray, ``writer(value, out)``, so a whole
+    structure serializes into one buffer. Types providing ``_encode_into`` (compiled structs and enums) write
+    themselves, primitives use inline codecs, u8 vectors are copied as blocks and other variable length vectors,
+    including nested ones, use the ULEB128 fast path. Anything else wraps canoser's own encoder.
+    """
+    if isinstance(mtype, type):
+        if mtype in _PRIM_CODECS:
+            return _PRIM_CODECS[mtype]
+        encode_into = getattr(mtype, "_encode_into", None)
+        if encode_into is not None:
+            return encode_into, mtype.decode
+        if issubclass(mtype, canoser.RustOptional):
+            return _optional_codec(mtype)
+    elif isinstance(mtype, canoser.ArrayT):
+        if mtype.atype is canoser.Uint8:
+            return _byte_vector_codec(mtype.fixed_len, mtype.encode_len)
+        if mtype.encode_len and mtype.fixed_len is None:
+            return _vector_codec(*_field_codec(mtype.atype))
+    return _bytes_writer(mtype.encode), mtype.decode
+
+
+class CompiledStruct(canoser.Struct):
+    """CompiledStruct canoser.Struct that resolves its field codecs once, when the class is created.
+
+    canoser.Struct walks ``_fields`` and calls ``type_mapping`` for every field on every encode and decode.
+    Subclasses instead carry ``_compiled``, a tuple of (name, writer, decoder) built from ``_fields``, and
+    write nested fields into the one output buffer.
+    """
+
+    _compiled: tuple = ()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """__init_subclass__ Compile the subclass ``_fields`` into ``_compiled``."""
+        super().__init_subclass__(**kwargs)
+        compiled = []
+        for name, atype in cls._fields:
+            compiled.append((name, *_field_codec(canoser.types.type_mapping(atype))))
+        cls._compiled = tuple(compiled)
+
+    def _encode_into(self, out: bytearray) -> None:
+        """_encode_into Write each field with its compiled writer into out."""
+        for name, write, _ in self._compiled:
+            write(getattr(self, name), out)
+
+    @classmethod
+    def encode(cls, obj: "CompiledStruct") -> bytes:
+        """encode Encode into a single output buffer."""
+        out = bytearray()
+        cls._encode_into(obj, out)
+        return bytes(out)
+
+    @classmethod
+    def decode(cls, cursor: canoser.Cursor) -> "CompiledStruct":
+        """decode Decode each field with its compiled decoder.
+
+        Decoded values are correct by construction so they bypass the canoser field type checks.
+        """
+        ret = cls.__new__(cls)
+        values = ret.__dict__
+        for name, _, dec in cls._compiled:
+            values[name] = dec(cursor)
+        return ret
+
+
+class CompiledEnum(canoser.RustEnum):
+    """CompiledEnum canoser.RustEnum with its variant tables built once, when the class is created.
+
+    canoser.RustEnum scans ``_enums`` for a variant name and calls ``type_mapping`` per construction and decode.
+    Subclasses instead carry per variant tables indexed by the variant index and a name to index dict.
+    """
+
+    _index_by_name: dict[str, int] = {}
+    _value_types: tuple = ()
+    _tags: tuple[bytes, ...] = ()
+    _encoders: tuple = ()
+    _decoders: tuple = ()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """__init_subclass__ Build the subclass variant tables from ``_enums``."""
+        super().__init_subclass__(**kwargs)
+        cls._compile_variants()
+
+    @classmethod
+    def _compile_variants(cls) -> None:
+        """_compile_variants Freeze ``_enums`` as a tuple and (re)build the variant tables from it."""
+        cls._enums = tuple(cls._enums)
+        value_types = tuple(canoser.types.type_mapping(datatype) for _, datatype in cls._enums)
+        codecs = [_field_codec(mtype) if mtype is not None else (None, None) for mtype in value_types]
+        cls._index_by_name = {name: index for index, (name, _) in enumerate(cls._enums)}
+        cls._value_types = value_types
+        cls._tags = tuple(canoser.Uint32.serialize_uint32_as_uleb128(index) for index in range(len(cls._enums)))
+        cls._encoders = tuple(write for write, _ in codecs)
+        cls._decoders = tuple(dec for _, dec in codecs)
+
+    @classmethod
+    def get_index(cls, name: str) -> int:
+        """get_index Variant index for name from the name to index dict."""
+        try:
+            return cls._index_by_name[name]
+        except KeyError:
+            raise TypeError(f"name:{name} not in enum {cls}") from None
+
+    def _init_with_index_value(self, index: int, value: Any, datatype: Any) -> None:
+        """_init_with_index_value Set the variant using the precomputed value type."""
+        self._index = index
+        self.value_type = self._value_types[index]
+        self.value = value
+
+    def _encode_into(self, out: bytearray) -> None:
+        """_encode_into Write the precomputed variant tag followed by the variant value, if any, into out."""
+        index = self._index
+        out += self._tags[index]
+        write = self._encoders[index]
+        if write is not None:
+            write(self.value, out)
+
+    @classmethod
+    def encode(cls, enum: "CompiledEnum") -> bytes:
+        """encode Encode into a single output buffer."""
+        out = bytearray()
+        cls._encode_into(enum, out)
+        return bytes(out)
+
+    @classmethod
+    def decode(cls, cursor: canoser.Cursor) -> "CompiledEnum":
+        """decode Dispatch the variant value decode through the decoder table.
+
+        Decoded values are correct by construction so they bypass the canoser value type check.
+        """
+        index = read_uleb128(cursor)
+        dec = cls._decoders[index]
+        ret = cls.__new__(cls)
+        values = ret.__dict__
+        values["_index"] = index
+        values["value_type"] = cls._value_types[index]
+        values["value"] = dec(cursor) if dec is not None else None
+        return ret
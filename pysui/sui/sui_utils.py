@@ -228,7 +228,6 @@ def sui_base_get_config() -> tuple[Path, Path]:
     """
     # Have the system expand path and resolve symlinks
     active_path = Path(os.readlink(os.path.expanduser(SUI_BASE_ACTIVE)))
-    print(active_path)
     astem = active_path.stem
     match astem:
         case "localnet" | "devnet" | "testnet":
@@ -634,8 +633,3 @@ COERCION_FN_MAP = {
     NoneType: lambda x: SuiNullType(),
     Any: lambda x: x,
 }
-
-if __name__ == "__main__":
-    ppath = Path(os.path.expanduser("~/frankc01/sui-track"))
-    stuff = publish_build(ppath)
-    print("Yo")
@@ -35,9 +35,9 @@ import json
 PROJECT_DIR = pathlib.Path(os.path.dirname(__file__))
 PARENT = PROJECT_DIR.parent
 
-sys.path.insert(0, str(PROJECT_DIR))
-sys.path.insert(0, str(PARENT))
-sys.path.insert(0, str(os.path.join(PARENT, "pysui")))
+# Running as a script from a source tree needs the repo root for the pysui and samples packages
+if __name__ == "__main__":
+    sys.path.insert(0, str(PARENT))
 
 
 from pysui.sui.sui_constants import SUI_COIN_DENOMINATOR
@@ -22,9 +22,9 @@ import sys
 PROJECT_DIR = pathlib.Path(os.path.dirname(__file__))
 PARENT = PROJECT_DIR.parent
 
-sys.path.insert(0, str(PROJECT_DIR))
-sys.path.insert(0, str(PARENT))
-sys.path.insert(0, str(os.path.join(PARENT, "pysui")))
+# Running as a script from a source tree needs the repo root for the pysui and samples packages
+if __name__ == "__main__":
+    sys.path.insert(0, str(PARENT))
 
 from pysui.sui.sui_config import SuiConfig
 from pysui.sui.sui_clients.sync_client import SuiClient
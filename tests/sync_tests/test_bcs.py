@@ -0,0 +1,178 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Testing BCS serialization types."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from pysui.sui.sui_clients.transaction import SuiTransaction
+from pysui.sui.sui_txresults.common import GenericRef
+from pysui.sui.sui_types import bcs
+
+_SENDER = "0x" + "ab" * 32
+_PACKAGE = "0x" + "cd" * 32
+_COIN = "0x" + "0e" * 32
+_DIGEST = "4vJ9JU1bJJE96FWSJKvHsmmFADCg4gpZQff4P3bkLKi"
+# Serialization of _build_tx produced by the canoser only (pre 0.25.1) BCS types
+_TX_DATA_HEX: str = (
+    "0000050008809698000000000000ca01c8016161616161616161616161616161616161616161616161616161616161616161"
+    "6161616161616161616161616161616161616161616161616161616161616161616161616161616161616161616161616161"
+    "6161616161616161616161616161616161616161616161616161616161616161616161616161616161616161616161616161"
+    "6161616161616161616161616161616161616161616161616161616161616161616161616161616161616161616161616161"
+    "61616161616161616161616161616161616101000e0e0e0e0e0e0e0e0e0e0e0e0e0e0e0e0e0e0e0e0e0e0e0e0e0e0e0e0e0e"
+    "0e0e070000000000000020010101010101010101010101010101010101010101010101010101010101010101010000000000"
+    "0000000000000000000000000000000000000000000000000000060100000000000000000020abababababababababababab"
+    "abababababababababababababababababababab0802000101000000cdcdcdcdcdcdcdcdcdcdcdcdcdcdcdcdcdcdcdcdcdcd"
+    "cdcdcdcdcdcdcdcdcdcd05707973756908657865726369736503070000000000000000000000000000000000000000000000"
+    "00000000000000000204636f696e04436f696e01070000000000000000000000000000000000000000000000000000000000"
+    "0000020373756903535549000601010203010100010300030000000003010200010300000000050107000000000000000000"
+    "000000000000000000000000000000000000000000000204636f696e04436f696e0107000000000000000000000000000000"
+    "0000000000000000000000000000000002037375690353554900020102000201000500010203000402820100010203040506"
+    "0708090a0b0c0d0e0f101112131415161718191a1b1c1d1e1f202122232425262728292a2b2c2d2e2f303132333435363738"
+    "393a3b3c3d3e3f404142434445464748494a4b4c4d4e4f505152535455565758595a5b5c5d5e5f606162636465666768696a"
+    "6b6c6d6e6f707172737475767778797a7b7c7d7e7f808104a11ceb0b02000000000000000000000000000000000000000000"
+    "00000000000000000000010000000000000000000000000000000000000000000000000000000000000002060105a11ceb0b"
+    "06010000000000000000000000000000000000000000000000000000000000000002cdcdcdcdcdcdcdcdcdcdcdcdcdcdcdcd"
+    "cdcdcdcdcdcdcdcdcdcdcdcdcdcdcdcd0205000101020100010400ababababababababababababababababababababababab"
+    "ababababababababab010e0e0e0e0e0e0e0e0e0e0e0e0e0e0e0e0e0e0e0e0e0e0e0e0e0e0e0e0e0e0e0e0700000000000000"
+    "200101010101010101010101010101010101010101010101010101010101010101ababababababababababababababababab"
+    "abababababababababababababababe80300000000000080f0fa0200000000010c00000000000000"
+)
+
+_CLOCK_READ = SimpleNamespace(object_id="0x6", owner=SimpleNamespace(initial_shared_version=1, mutable=False))
+
+
+def test_shared_reference_not_shared() -> None:
+    """Test marking a shared object argument mutable leaves other references to the object untouched."""
+    first = bcs.SharedObjectReference.from_object_read(_CLOCK_READ)
+    assert first is not bcs.SharedObjectReference.from_object_read(_CLOCK_READ)
+    arg = (bcs.BuilderArg("Object", first.ObjectID), bcs.ObjectArg("SharedObject", first))
+    b_arg, r_arg = SuiTransaction._mutable_object_arg(arg)
+    assert b_arg is arg[0]
+    assert r_arg.value.Mutable is True
+    assert r_arg.value.ObjectID == first.ObjectID and r_arg.value.SequenceNumber == 1
+    assert first.Mutable is False
+    assert bcs.SharedObjectReference.from_object_read(_CLOCK_READ).Mutable is False
+
+
+def test_owned_reference_not_mutated() -> None:
+    """Test owned object arguments are left as is for mutable reference parameters."""
+    ref = bcs.ObjectReference.from_generic_ref(GenericRef("0x5", 3, "4vJ9JU1bJJE96FWSJKvHsmmFADCg4gpZQff4P3bkLKi"))
+    arg = (bcs.BuilderArg("Object", ref.ObjectID), bcs.ObjectArg("ImmOrOwnedObject", ref))
+    assert SuiTransaction._mutable_object_arg(arg) is arg
+    assert "Mutable" not in vars(ref)
+
+
+def _build_tx():
+    """Build a TransactionData covering every command and argument kind."""
+    coin_ref = bcs.ObjectReference(bcs.Address.from_str(_COIN), 7, bcs.Digest.from_str(_DIGEST))
+    clock_ref = bcs.SharedObjectReference(bcs.Address.from_str("0x6"), 1, False)
+    inputs = [
+        bcs.CallArg("Pure", [0x80, 0x96, 0x98, 0x00, 0x00, 0x00, 0x00, 0x00]),
+        bcs.CallArg("Pure", [200, 1] + [0x61] * 200),
+        bcs.CallArg("Object", bcs.ObjectArg("ImmOrOwnedObject", coin_ref)),
+        bcs.CallArg("Object", bcs.ObjectArg("SharedObject", clock_ref)),
+        bcs.CallArg("Pure", list(bcs.Address.from_str(_SENDER).Address)),
+    ]
+    nested = bcs.TypeTag.type_tag_from("0x2::coin::Coin<0x2::sui::SUI>")
+    vec_u8 = bcs.TypeTag.type_tag_from("vector<u8>")
+    commands = [
+        bcs.Command("SplitCoin", bcs.SplitCoin(bcs.Argument("GasCoin"), [bcs.Argument("Input", 0)])),
+        bcs.Command(
+            "MoveCall",
+            bcs.ProgrammableMoveCall(
+                bcs.Address.from_str(_PACKAGE),
+                "pysui",
+                "exercise",
+                [nested, vec_u8, bcs.TypeTag("U64")],
+                [bcs.Argument("Input", 1), bcs.Argument("Input", 3), bcs.Argument("NestedResult", (0, 0))],
+            ),
+        ),
+        bcs.Command("MergeCoins", bcs.MergeCoins(bcs.Argument("Input", 2), [bcs.Argument("NestedResult", (0, 0))])),
+        bcs.Command(
+            "MakeMoveVec",
+            bcs.MakeMoveVec(bcs.OptionalTypeTag(nested), [bcs.Argument("Input", 2), bcs.Argument("Result", 1)]),
+        ),
+        bcs.Command("MakeMoveVec", bcs.MakeMoveVec(bcs.OptionalTypeTag(None), [bcs.Argument("Result", 3)])),
+        bcs.Command(
+            "Publish",
+            bcs.Publish(
+                [list(range(130)), [0xA1, 0x1C, 0xEB, 0x0B]], [bcs.Address.from_str("0x1"), bcs.Address.from_str("0x2")]
+            ),
+        ),
+        bcs.Command(
+            "Upgrade",
+            bcs.Upgrade(
+                [[0xA1, 0x1C, 0xEB, 0x0B, 0x06]],
+                [bcs.Address.from_str("0x2")],
+                bcs.Address.from_str(_PACKAGE),
+                bcs.Argument("Result", 5),
+            ),
+        ),
+        bcs.Command("TransferObjects", bcs.TransferObjects([bcs.Argument("Result", 1)], bcs.Argument("Input", 4))),
+    ]
+    gas_data = bcs.GasData([coin_ref], bcs.Address.from_str(_SENDER), 1000, 50_000_000)
+    return bcs.TransactionData(
+        "V1",
+        bcs.TransactionDataV1(
+            bcs.TransactionKind("ProgrammableTransaction", bcs.ProgrammableTransaction(inputs, commands)),
+            bcs.Address.from_str(_SENDER),
+            gas_data,
+            bcs.TransactionExpiration("Epoch", 12),
+        ),
+    )
+
+
+def test_transaction_data_bytes() -> None:
+    """Test a transaction serializes to known good bytes and round trips."""
+    tx_data = _build_tx()
+    serialized = tx_data.serialize()
+    assert serialized.hex() == _TX_DATA_HEX
+    deserialized = bcs.TransactionData.deserialize(serialized)
+    assert deserialized.serialize() == serialized
+    assert json.dumps(deserialized.to_json_serializable()) == json.dumps(tx_data.to_json_serializable())
+
+
+def test_modules_as_bytes() -> None:
+    """Test Publish modules given as bytes serialize the same as lists of ints."""
+    modules = [list(range(130)), [0xA1, 0x1C, 0xEB, 0x0B]]
+    deps = [bcs.Address.from_str("0x1")]
+    assert bcs.Publish([bytes(x) for x in modules], deps).serialize() == bcs.Publish(modules, deps).serialize()
+
+
+def test_variant_for_index() -> None:
+    """Test TransactionData.variant_for_index rejects indexes past the last variant."""
+    assert bcs.TransactionData.variant_for_index(0) == ("V1", bcs.TransactionDataV1)
+    with pytest.raises(IndexError):
+        bcs.TransactionData.variant_for_index(1)
+
+
+def test_type_tag_frozen() -> None:
+    """Test TypeTag variants can not be changed once the module has loaded."""
+    assert bcs.TypeTag._enums[6] == ("Vector", [bcs.TypeTag])
+    assert bcs.TypeTag._enums[7] == ("Struct", bcs.StructTag)
+    with pytest.raises(TypeError):
+        bcs.TypeTag.update_value_at(7, None)
+    assert bcs.TypeTag._enums[7] == ("Struct", bcs.StructTag)
+
+
+def test_well_known_addresses() -> None:
+    """Test well known system addresses are shared and other addresses are not."""
+    assert bcs.Address.from_str("0x6") is bcs.Address.from_str("0x" + "0" * 63 + "6")
+    assert bcs.Address.from_str("0x2") is bcs.Address.from_str("0x2")
+    assert bcs.Address.from_str("0x403").to_address_str() == "0x" + "0" * 61 + "403"
+    assert bcs.Address.from_str(_SENDER) is not bcs.Address.from_str(_SENDER)
+    assert bcs.Address.from_str(_SENDER) == bcs.Address.from_str(_SENDER)
@@ -0,0 +1,144 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Testing key signing and verification."""
+
+import base64
+import binascii
+import hashlib
+
+import pyroaring
+import pytest
+
+from pysui.abstracts.client_keypair import SignatureScheme
+from pysui.sui.sui_crypto import (
+    MultiSig,
+    SuiPublicKeySECP256K1,
+    SuiPublicKeySECP256R1,
+    _derive_cached,
+    create_new_keypair,
+    keypair_from_keystring,
+)
+from pysui.sui.sui_crypto_batch import create_new_keypairs, verify_ed25519_batch, verify_signatures
+from pysui.sui.sui_excepts import SuiInvalidKeyPair, SuiInvalidKeystringLength
+from pysui.sui.sui_types.bcs import MultiSignature
+
+_MESSAGE: bytes = b"pysui signature verification"
+
+
+@pytest.mark.parametrize("scheme", [SignatureScheme.ED25519, SignatureScheme.SECP256K1, SignatureScheme.SECP256R1])
+def test_sign_verify(scheme: SignatureScheme) -> None:
+    """Test a signature verifies with its public key and fails on altered data."""
+    _, keypair = create_new_keypair(scheme)
+    signature = keypair.private_key.sign(_MESSAGE)
+    assert len(signature) == 64
+    assert keypair.public_key.verify(_MESSAGE, signature)
+    assert not keypair.public_key.verify(_MESSAGE + b"!", signature)
+    _, other = create_new_keypair(scheme)
+    assert not other.public_key.verify(_MESSAGE, signature)
+
+
+@pytest.mark.parametrize("scheme", [SignatureScheme.ED25519, SignatureScheme.SECP256K1, SignatureScheme.SECP256R1])
+def test_verify_malformed_signature(scheme: SignatureScheme) -> None:
+    """Test malformed signatures fail verification rather than raise."""
+    _, keypair = create_new_keypair(scheme)
+    signature = keypair.private_key.sign(_MESSAGE)
+    malformed = [
+        b"\xff" * 64,
+        b"\x00" * 64,
+        b"\xff" * 32 + signature[32:],
+        signature[:32] + b"\xff" * 32,
+        b"",
+        signature[:63],
+    ]
+    for bad in malformed:
+        assert not keypair.public_key.verify(_MESSAGE, bad)
+    items = [(keypair.public_key, _MESSAGE, bad) for bad in malformed] + [(keypair.public_key, _MESSAGE, signature)]
+    assert verify_signatures(items) == [False] * len(malformed) + [True]
+
+
+@pytest.mark.parametrize("key_class", [SuiPublicKeySECP256K1, SuiPublicKeySECP256R1])
+def test_invalid_public_key_point(key_class: type) -> None:
+    """Test SECP public keys are validated as curve points when constructed."""
+    with pytest.raises(SuiInvalidKeyPair):
+        key_class(b"\x02" + b"\xff" * 32)
+
+
+def test_verify_signatures() -> None:
+    """Test bulk verification of mixed schemes keeps the results in order."""
+    items = []
+    for scheme in [SignatureScheme.ED25519, SignatureScheme.SECP256K1, SignatureScheme.SECP256R1]:
+        for _, keypair in create_new_keypairs(2, scheme):
+            items.append((keypair.public_key, _MESSAGE, keypair.private_key.sign(_MESSAGE)))
+    # Swap the signatures of the second ED25519 and second SECP256K1 items
+    items[1], items[3] = (items[1][0], _MESSAGE, items[3][2]), (items[3][0], _MESSAGE, items[1][2])
+    assert verify_signatures(items) == [True, False, True, False, True, True]
+    assert verify_signatures([]) == []
+
+
+def test_verify_split_signature() -> None:
+    """Test moving signed message bytes into the signature does not verify."""
+    _, keypair = create_new_keypair(SignatureScheme.ED25519)
+    message = b"transfer 10 SUI to alice"
+    signature = keypair.private_key.sign(message)
+    forged = [(keypair.public_key.key_bytes, b"to alice", signature + b"transfer 10 SUI ")]
+    assert verify_ed25519_batch(forged) == [False]
+    assert verify_ed25519_batch([(keypair.public_key.key_bytes, message, signature[:63])]) == [False]
+    assert verify_signatures([(keypair.public_key, b"to alice", signature + b"transfer 10 SUI ")]) == [False]
+    assert verify_ed25519_batch([(keypair.public_key.key_bytes, message, signature)]) == [True]
+
+
+def test_derive_cache() -> None:
+    """Test only keys from supplied mnemonics are cached and cache_clear purges them."""
+    create_new_keypair.cache_clear()
+    mnemonic, keypair = create_new_keypair(SignatureScheme.ED25519)
+    assert _derive_cached.cache_info().currsize == 0
+    _, recovered = create_new_keypair(SignatureScheme.ED25519, mnemonic)
+    assert recovered.serialize() == keypair.serialize()
+    assert _derive_cached.cache_info().currsize == 1
+    create_new_keypair.cache_clear()
+    assert _derive_cached.cache_info().currsize == 0
+
+
+def test_keystring_errors() -> None:
+    """Test malformed and wrong length keystrings are rejected."""
+    _, keypair = create_new_keypair(SignatureScheme.ED25519)
+    keystring = keypair.serialize()
+    assert keypair_from_keystring(keystring).serialize() == keystring
+    with pytest.raises(binascii.Error):
+        keypair_from_keystring(keystring[:-1])
+    with pytest.raises(binascii.Error):
+        keypair_from_keystring("!" + keystring[1:])
+    with pytest.raises(SuiInvalidKeystringLength, match="length of 32"):
+        keypair_from_keystring(base64.b64encode(keypair.private_key.key_bytes).decode())
+
+
+def test_multisig_signer_order() -> None:
+    """Test signing with a non prefix, unordered, subset of MultiSig keys."""
+    keys = [create_new_keypair(SignatureScheme.ED25519)[1] for _ in range(3)]
+    msig = MultiSig(keys, [1, 2, 3], 3)
+    pub_keys = msig.public_keys
+    signers = [pub_keys[2], pub_keys[0]]
+    assert msig.validate_signers(signers) == [0, 2]
+    with pytest.raises(ValueError):
+        msig.validate_signers([pub_keys[1]])
+
+    tx_bytes = base64.b64encode(b"pysui multisig transaction").decode()
+    msig_sig = MultiSignature.deserialize(base64.b64decode(msig.sign(tx_bytes, signers).value))
+    assert list(pyroaring.BitMap.deserialize(bytes(msig_sig.RoaringBitMap.RoaringBitmap))) == [0, 2]
+    assert [pk.Weight for pk in msig_sig.PkMap] == [1, 2, 3]
+    digest = hashlib.blake2b(b"\x00\x00\x00" + base64.b64decode(tx_bytes), digest_size=32).digest()
+    assert len(msig_sig.Sigs) == 2
+    for sig, index in zip(msig_sig.Sigs, [0, 2]):
+        assert sig.Sig[0] == SignatureScheme.ED25519
+        assert pub_keys[index].verify(digest, bytes(sig.Sig[1:]))
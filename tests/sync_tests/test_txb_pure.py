@@ -0,0 +1,33 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Testing SuiTransaction pure argument encoding."""
+
+from pysui.sui.sui_clients.transaction_builder import PureInput
+
+
+def test_pure_str_length() -> None:
+    """Test str lengths over 127 bytes are written as multi byte ULEB128."""
+    assert PureInput.pure("a" * 5) == [5] + [0x61] * 5
+    assert PureInput.pure("a" * 127) == [0x7F] + [0x61] * 127
+    assert PureInput.pure("a" * 128) == [0x80, 0x01] + [0x61] * 128
+    # Length is of the utf-8 encoding, not the character count
+    assert PureInput.pure("é" * 100)[:2] == [0xC8, 0x01]
+    assert PureInput.pure("a" * 20000)[:3] == [0xA0, 0x9C, 0x01]
+
+
+def test_pure_list_length() -> None:
+    """Test list lengths over 127 items are written as multi byte ULEB128."""
+    assert PureInput.pure([True] * 127) == [0x7F] + [1] * 127
+    assert PureInput.pure([True] * 130) == [0x82, 0x01] + [1] * 130
+    assert PureInput.pure(["ab"] * 200) == [0xC8, 0x01] + [2, 0x61, 0x62] * 200